@@ -14,20 +14,42 @@ Enhanced Modern Web Scraper & Curl Platform (Flask + Bootstrap)
   * Three themes: light (gradient bg, black text), dark (black bg, white text), dark-alt (white bg, black text)
 
 Keep this file as `enhanced_scraper.py` and run with `python3 enhanced_scraper.py`.
+
+requests, BeautifulSoup, openpyxl and pandas are imported on first use so workers that never
+need them (e.g. curl mode, CSV/JSON downloads) boot fast; `bench_import.py` measures this.
 """
 
-from flask import Flask, request, render_template_string, send_file, redirect, url_for, flash, session
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from flask import Flask, Response, jsonify, request, render_template_string, send_file, redirect, url_for, flash, session, stream_with_context
 import io
+import os
+import math
+import hashlib
+import sys
+import time
+import socket
+import sqlite3
+from contextlib import closing
+import csv
+import itertools
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import codecs
 import json
 import re
+from array import array
 from urllib.parse import urlparse, urljoin
+from html.parser import HTMLParser
 from datetime import datetime
-import openpyxl
 import traceback
 
+try:  # optional fast JSON parser
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 app.secret_key = "change_this_secret_in_production_please"
 
@@ -368,6 +390,11 @@ TEMPLATE = """
                 <label class="form-label">Custom Headers (JSON)</label>
                 <textarea name="custom_headers" class="form-control" rows="2" placeholder='{"Authorization": "Bearer token"}'>{{ request.form.get('custom_headers','') }}</textarea>
               </div>
+              <div class="mb-3">
+                <label class="form-label">JSON Filter (optional)</label>
+                <input name="json_filter" type="text" class="form-control" placeholder="e.g. $.data[*] or $.results[*].user" value="{{ request.form.get('json_filter','') }}">
+                <div class="form-text">Streams the response and exports matched records as a table.</div>
+              </div>
               <div class="form-check mb-3">
                 <input class="form-check-input" type="checkbox" name="post_method" {% if request.form.get('post_method') %}checked{% endif %}>
                 <label class="form-check-label">POST Method</label>
@@ -397,6 +424,14 @@ TEMPLATE = """
                   <input name="regex_pattern" type="text" class="form-control" placeholder="e.g. \\d{4}-\\d{2}-\\d{2}" value="{{ request.form.get('regex_pattern','') }}">
                 </div>
               </div>
+              <div class="mb-3">
+                <label class="form-label">Embedded JSON Paths (optional)</label>
+                <div class="input-group">
+                  <span class="input-group-text"><i class="fas fa-brackets-curly"></i></span>
+                  <input name="json_paths" type="text" class="form-control" placeholder="e.g. $..name, $.props.pageProps.items[*].price" value="{{ request.form.get('json_paths','') }}">
+                </div>
+                <div class="form-text">Reads JSON-LD, __NEXT_DATA__ and inline state blobs instead of the rendered HTML.</div>
+              </div>
               <div class="row">
                 <div class="col-md-6">
                   <label class="form-label">User-Agent</label>
@@ -408,8 +443,8 @@ TEMPLATE = """
                 </div>
               </div>
               <div class="form-check mt-3">
-                <input class="form-check-input" type="checkbox" name="unique" {% if request.form.get('unique') %}checked{% endif %}>
-                <label class="form-check-label">Unique Results Only</label>
+                <input class="form-check-input" type="checkbox" name="skip_seen" {% if request.form.get('skip_seen') %}checked{% endif %}>
+                <label class="form-check-label">Skip Rows Seen in Earlier Runs</label>
               </div>
               <div class="form-check mt-3">
                 <input class="form-check-input" type="checkbox" name="clean_data" {% if request.form.get('clean_data') %}checked{% endif %}>
@@ -417,6 +452,12 @@ TEMPLATE = """
               </div>
             </div>
 
+            <div class="form-check mt-3">
+              <input class="form-check-input" type="checkbox" name="unique" {% if request.form.get('unique') %}checked{% endif %}>
+              <label class="form-check-label">Unique Results Only</label>
+              <div class="form-text">Drops repeated scraped rows and repeated JSON-filtered curl records.</div>
+            </div>
+
             <div class="row mb-4 mt-4">
               <div class="col-md-6">
                 <label class="form-label fw-bold fs-6">Download Format</label>
@@ -429,6 +470,7 @@ TEMPLATE = """
               </div>
               <div class="col-md-6 d-flex align-items-end gap-2">
                 <button type="submit" class="btn btn-primary btn-modern w-100"><i class="fas fa-magic me-2"></i>Generate & Preview</button>
+                <button type="submit" formaction="{{ url_for('enqueue_jobs') }}" class="btn btn-outline-light btn-modern w-100"><i class="fas fa-layer-group me-2"></i>Queue Job</button>
                 <button type="button" class="btn btn-outline-light btn-modern w-100" onclick="runAutoFind()"><i class="fas fa-search me-2"></i>Auto Find Contact & Emails</button>
               </div>
             </div>
@@ -527,6 +569,102 @@ TEMPLATE = """
 </html>
 """
 
+# CPU-bound parsing runs in a process pool; set SCRAPER_EXTRACT_WORKERS=1 to parse in the request thread
+EXTRACT_WORKERS = int(os.environ.get("SCRAPER_EXTRACT_WORKERS", 0)) or (os.cpu_count() or 1)
+_EXTRACT_POOL = None
+_EXTRACT_POOL_LOCK = threading.Lock()
+
+def _extract_mp_context():
+    # the Flask server is multi-threaded, so don't fork it; forkserver/spawn start clean workers
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+def get_extract_pool():
+    """Return the shared extraction ProcessPoolExecutor, or None when parsing runs inline."""
+    global _EXTRACT_POOL
+    if EXTRACT_WORKERS <= 1:
+        return None
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is None:
+            _EXTRACT_POOL = ProcessPoolExecutor(max_workers=EXTRACT_WORKERS, mp_context=_extract_mp_context())
+        return _EXTRACT_POOL
+
+def _reset_extract_pool(pool=None):
+    """Shut down the shared pool; with `pool`, only if it is still that (failed) pool."""
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is None or (pool is not None and _EXTRACT_POOL is not pool):
+            return
+        _EXTRACT_POOL.shutdown(wait=False, cancel_futures=True)
+        _EXTRACT_POOL = None
+
+def run_extraction(fn, *args):
+    """Run fn(*args) in the extraction pool and wait for its (compact, picklable) result."""
+    pool = get_extract_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        fut = pool.submit(fn, *args)
+    except RuntimeError:  # broken, or shut down by another thread whose job broke it
+        _reset_extract_pool(pool)
+        return fn(*args)
+    try:
+        return fut.result()
+    except (BrokenProcessPool, CancelledError):
+        _reset_extract_pool(pool)
+        return fn(*args)
+
+def bounded_map(fn, jobs, max_pending: int = None):
+    """Yield (tag, fn(*args)) for each (tag, args) in `jobs`, in order, using the extraction pool.
+
+    At most `max_pending` documents are in flight at once, so memory stays bounded while a
+    lazy `jobs` generator (e.g. one that fetches pages) keeps the workers busy. A job that
+    raises yields (tag, None). If the pool breaks, affected jobs and the rest of the run
+    are executed inline.
+    """
+    pool = get_extract_pool()
+    max_pending = max_pending or 2 * EXTRACT_WORKERS
+    pending = deque()
+
+    def inline(args):
+        try:
+            return fn(*args)
+        except Exception:
+            return None
+
+    def result(args, fut):
+        nonlocal pool
+        try:
+            return fut.result()
+        except (BrokenProcessPool, CancelledError):
+            if pool is not None:
+                _reset_extract_pool(pool)
+                pool = None
+            return inline(args)
+        except Exception:
+            return None
+
+    for tag, args in jobs:
+        if pool is not None:
+            try:
+                pending.append((tag, args, pool.submit(fn, *args)))
+            except RuntimeError:  # broken, or shut down by another thread whose job broke it
+                _reset_extract_pool(pool)
+                pool = None
+        if pool is None:
+            # drain in-flight jobs first so results keep their order
+            while pending:
+                done_tag, done_args, fut = pending.popleft()
+                yield done_tag, result(done_args, fut)
+            yield tag, inline(args)
+            continue
+        if len(pending) >= max_pending:
+            done_tag, done_args, fut = pending.popleft()
+            yield done_tag, result(done_args, fut)
+    while pending:
+        done_tag, done_args, fut = pending.popleft()
+        yield done_tag, result(done_args, fut)
+
 # store last results in a module-level variable; we will assign with global keyword
 _LAST_RESULTS = {}
 
@@ -537,6 +675,698 @@ REGEX_PRESETS = {
     'url': r"https?://[\w\-._~:/?#\[\]@!$&'()*+,;=]+"
 }
 
+class RowStore:
+    """Compact column-oriented storage for result rows.
+
+    While rows are appended, each column is a list of str and repeated values share one
+    string object. `freeze()` then drops the lookup dicts and packs every column: when fewer
+    than half its cells are distinct (e.g. AutoFind's ``source_url``/``link_text``) as the
+    distinct values plus an array of 4-byte codes, otherwise as one UTF-8 blob plus an array
+    of end offsets, which avoids a Python str object per cell. DataFrames and export formats
+    are built on demand from the store.
+    """
+    __slots__ = ('columns', '_index', '_cells', '_values', '_lookup')
+
+    def __init__(self, columns, rows=None):
+        self.columns = list(columns)
+        self._index = {}  # column name -> position, for append_dict
+        for col, name in enumerate(self.columns):
+            self._index.setdefault(name, col)
+        self._cells = [[] for _ in self.columns]   # per column: list (building), array of codes, or (blob, ends)
+        self._values = [None for _ in self.columns]  # per column: distinct values when dictionary-encoded
+        self._lookup = [{} for _ in self.columns]   # per column: value -> shared str, only while building
+        if rows is not None:
+            self.extend(rows)
+            self.freeze()
+
+    def _thaw(self):
+        """Return to the appendable list form after `freeze()`."""
+        lookups = []
+        for col in range(len(self.columns)):
+            cells = list(self._iter_column(col))
+            self._cells[col] = cells
+            self._values[col] = None
+            lookups.append({v: v for v in cells})
+        self._lookup = lookups
+
+    def append(self, row):
+        if self._lookup is None:
+            self._thaw()
+        for col in range(len(self.columns)):
+            value = row[col] if col < len(row) else ""
+            value = "" if value is None else str(value)
+            self._cells[col].append(self._lookup[col].setdefault(value, value))
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def add_column(self, name: str):
+        """Add a column, filling existing rows with empty strings."""
+        if self._lookup is None:
+            self._thaw()
+        self._index.setdefault(name, len(self.columns))
+        self.columns.append(name)
+        self._cells.append([""] * len(self))
+        self._values.append(None)
+        self._lookup.append({"": ""})
+
+    def append_dict(self, record: dict):
+        """Append a {column: value} mapping, creating columns on first sight."""
+        index = self._index
+        for name in record:
+            if name not in index:
+                self.add_column(name)
+        row = [""] * len(self.columns)
+        for name, value in record.items():
+            row[index[name]] = value
+        self.append(row)
+
+    def freeze(self):
+        """Pack the columns and drop the build-time lookups; appending later still works."""
+        if self._lookup is None:
+            return self
+        n = len(self)
+        for col, lookup in enumerate(self._lookup):
+            if len(lookup) < n // 2:
+                codes = {v: i for i, v in enumerate(lookup)}
+                self._values[col] = tuple(lookup)
+                self._cells[col] = array('I', [codes[v] for v in self._cells[col]])
+            else:
+                encoded = [v.encode('utf-8', 'surrogatepass') for v in self._cells[col]]
+                self._cells[col] = (b''.join(encoded), array('Q', itertools.accumulate(map(len, encoded))))
+        self._lookup = None
+        return self
+
+    def _iter_column(self, col: int):
+        cells, values = self._cells[col], self._values[col]
+        if values is not None:
+            return map(values.__getitem__, cells)
+        if isinstance(cells, tuple):
+            return self._iter_packed(*cells)
+        return iter(cells)
+
+    @staticmethod
+    def _iter_packed(blob: bytes, ends):
+        start = 0
+        for end in ends:
+            yield blob[start:end].decode('utf-8', 'surrogatepass')
+            start = end
+
+    def __len__(self):
+        if not self._cells:
+            return 0
+        cells = self._cells[0]
+        return len(cells[1]) if isinstance(cells, tuple) else len(cells)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        return self.iter_rows()
+
+    def iter_rows(self, limit: int = None):
+        """Yield decoded rows as lists, optionally stopping after `limit` rows."""
+        n = len(self) if limit is None else min(limit, len(self))
+        if not self.columns:
+            return
+        columns = [self._iter_column(col) for col in range(len(self.columns))]
+        for row in itertools.islice(zip(*columns), n):
+            yield list(row)
+
+    def to_dataframe(self, limit: int = None):
+        import pandas as pd
+        return pd.DataFrame(list(self.iter_rows(limit)), columns=self.columns)
+
+# Encoding detection: header charset -> BOM -> <meta charset> sniff -> utf-8 check -> per-host cache -> sampled statistical detection
+SNIFF_BYTES = 4096
+DETECT_SAMPLE_BYTES = 64 * 1024
+DETECT_MIN_NON_ASCII = 64
+_ASCII_BYTES = bytes(range(128))
+_CHARSET_CACHE_MAX = 1024
+_CHARSET_CACHE = {}
+_HEADER_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+def _normalize_encoding(name) -> str:
+    """Return the canonical codec name for `name`, or None if Python does not know it."""
+    if not name:
+        return None
+    if isinstance(name, bytes):
+        name = name.decode('ascii', errors='ignore')
+    try:
+        return codecs.lookup(name.strip()).name
+    except LookupError:
+        return None
+
+def detect_encoding(content: bytes, content_type: str = "", host: str = "", partial: bool = False) -> str:
+    """Pick a codec for `content`; statistical detection only looks at a bounded sample.
+
+    Pass `partial=True` when `content` is only the start of the body (e.g. the first streamed
+    chunk), so a multi-byte character cut at its end still counts as valid UTF-8.
+    """
+    return _detect_encoding(content, content_type, host, partial)[0]
+
+def _detect_encoding(content: bytes, content_type: str = "", host: str = "", partial: bool = False):
+    """Return (codec, text); text is the decoded body when the UTF-8 check already produced it."""
+    match = _HEADER_CHARSET_RE.search(content_type or "")
+    enc = _normalize_encoding(match.group(1)) if match else None
+    if enc:
+        return enc, None
+
+    for bom, name in _BOMS:
+        if content.startswith(bom):
+            return name, None
+
+    ctype = (content_type or "").lower()
+    if 'json' in ctype:
+        return 'utf-8', None
+
+    match = _META_CHARSET_RE.search(content[:SNIFF_BYTES])
+    enc = _normalize_encoding(match.group(1)) if match else None
+    if enc:
+        return enc, None
+
+    try:
+        return 'utf-8', content.decode('utf-8')
+    except UnicodeDecodeError as exc:
+        if partial and exc.reason == 'unexpected end of data':
+            return 'utf-8', None
+        # sample where the non-UTF-8 bytes are, not a possibly all-ASCII head of the page
+        start = max(0, exc.start - 1024)
+        sample = content[start:start + DETECT_SAMPLE_BYTES]
+
+    if host in _CHARSET_CACHE:
+        return _CHARSET_CACHE[host], None
+
+    enc = None
+    # statistical detection needs material; a few accented letters are better served by
+    # the HTML legacy default below than by a guess such as mac-latin2
+    if len(sample.translate(None, _ASCII_BYTES)) >= DETECT_MIN_NON_ASCII:
+        try:
+            from charset_normalizer import from_bytes
+            best = from_bytes(sample).best()
+            enc = _normalize_encoding(best.encoding) if best else None
+        except Exception:
+            enc = None
+    enc = enc or 'cp1252'
+
+    if host:
+        if len(_CHARSET_CACHE) >= _CHARSET_CACHE_MAX:
+            _CHARSET_CACHE.clear()
+        _CHARSET_CACHE[host] = enc
+    return enc, None
+
+def decode_body(content: bytes, content_type: str = "", host: str = "") -> str:
+    """Decode a response body to text using `detect_encoding`; never raises."""
+    if isinstance(content, str):
+        return content
+    enc, text = _detect_encoding(content, content_type, host)
+    if text is not None:
+        # the strict UTF-8 check already decoded the body; don't decode it twice
+        return text
+    try:
+        return content.decode(enc, errors='replace')
+    except LookupError:
+        return content.decode('utf-8', errors='replace')
+
+def _json_loads(text):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+# Embedded JSON extraction (JSON-LD, __NEXT_DATA__, window.__STATE__ = {...}) without building a DOM
+_SCRIPT_OPEN_RE = re.compile(r'<script\b((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>', re.IGNORECASE)
+_SCRIPT_CLOSE_RE = re.compile(r'</script\s*>', re.IGNORECASE)
+_SCRIPT_ATTR_RE = re.compile(r'(?:^|\s)([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+)))?')
+_STATE_ASSIGN_RE = re.compile(r'(?:\b(?:window|self|globalThis)\.([A-Za-z_$][\w$]*)|\b(__[A-Za-z0-9_]+__))\s*=\s*(?=[{\[])')
+_JSON_DECODER = json.JSONDecoder()
+
+def extract_embedded_json(html: str):
+    """Return a list of (source, data) for JSON blobs embedded in <script> tags."""
+    blobs = []
+    pos = 0
+    while True:
+        m = _SCRIPT_OPEN_RE.search(html, pos)
+        if not m:
+            break
+        end = _SCRIPT_CLOSE_RE.search(html, m.end())
+        body_end = end.start() if end else len(html)
+        pos = end.end() if end else len(html)
+        attrs = {name.lower(): dq or sq or bare for name, dq, sq, bare in _SCRIPT_ATTR_RE.findall(m.group(1))}
+        if attrs.get('src'):
+            continue
+        stype = attrs.get('type', '').lower()
+        body = html[m.end():body_end]
+
+        if 'json' in stype:
+            text = body.strip()
+            if text.startswith('<!--'):
+                text = text[4:].rstrip('->').strip()
+            try:
+                blobs.append((attrs.get('id') or stype, _json_loads(text)))
+            except ValueError:
+                pass
+        elif not stype or 'javascript' in stype or stype == 'module':
+            for a in _STATE_ASSIGN_RE.finditer(body):
+                try:
+                    data, _ = _JSON_DECODER.raw_decode(body, a.end())
+                except ValueError:
+                    continue
+                blobs.append((a.group(1) or a.group(2), data))
+    return blobs
+
+_JSONPATH_TOKEN_RE = re.compile(r"""\.\.([^.\[\]]+)|\.([^.\[\]]+)|\[\s*(?:(-?\d+)|(\*)|'([^']*)'|"([^"]*)")\s*\]""")
+
+def compile_json_path(expr: str):
+    """Parse a JSONPath subset ($, .key, ..key, [n], [*], ['key']) into steps."""
+    expr = expr.strip()
+    if expr.startswith('$'):
+        expr = expr[1:]
+    elif expr and expr[0] not in '.[':
+        expr = '.' + expr
+    steps = []
+    pos = 0
+    for m in _JSONPATH_TOKEN_RE.finditer(expr):
+        if m.start() != pos:
+            raise ValueError(f"Invalid JSON path: {expr!r}")
+        pos = m.end()
+        descend, key, index, star, sq, dq = m.groups()
+        if descend is not None:
+            steps.append(('descend', descend))
+        elif index is not None:
+            steps.append(('index', int(index)))
+        elif star is not None:
+            steps.append(('child', '*'))
+        else:
+            steps.append(('child', next(k for k in (key, sq, dq) if k is not None)))
+    if pos != len(expr):
+        raise ValueError(f"Invalid JSON path: {expr!r}")
+    return steps
+
+def _json_children(node):
+    if isinstance(node, dict):
+        return node.values()
+    if isinstance(node, list):
+        return node
+    return ()
+
+def json_path_values(data, expr):
+    """Evaluate a JSON path (string or compiled steps) against `data` and return the list of matched values."""
+    nodes = [data]
+    for kind, key in (compile_json_path(expr) if isinstance(expr, str) else expr):
+        out = []
+        for node in nodes:
+            if kind == 'index':
+                if isinstance(node, list) and -len(node) <= key < len(node):
+                    out.append(node[key])
+            elif kind == 'child':
+                if key == '*':
+                    out.extend(_json_children(node))
+                elif isinstance(node, dict) and key in node:
+                    out.append(node[key])
+            else:  # descend
+                stack = [node]
+                while stack:
+                    cur = stack.pop()
+                    if isinstance(cur, dict) and (key == '*' or key in cur):
+                        out.extend(cur.values() if key == '*' else [cur[key]])
+                    stack.extend(reversed(list(_json_children(cur))))
+        nodes = out
+    return nodes
+
+# Streaming JSON: previews and path queries over chunked bodies without loading them whole
+STREAM_CHUNK_BYTES = 64 * 1024
+PREVIEW_CHARS = 10000
+_JSON_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\],:]|[^\s{}\[\],:"]+|\s+')
+
+_JSON_SCALAR_RE = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null|NaN|-?Infinity')
+_CLOSERS = {'}': '{', ']': '['}
+
+def _json_grammar_step(stack: list, expect: str, tok: str):
+    """Advance the JSON grammar by one non-space token; return the next state, or None if invalid.
+
+    States: 'value', 'value_or_close' (after '['), 'key', 'key_or_close' (after '{'), 'colon',
+    'comma_or_close' and 'end' (a complete top-level value). `stack` holds the open brackets.
+    """
+    if tok in _CLOSERS:
+        if not stack or stack[-1] != _CLOSERS[tok]:
+            return None
+        if expect not in ('comma_or_close', 'key_or_close' if tok == '}' else 'value_or_close'):
+            return None
+        stack.pop()
+        return 'comma_or_close' if stack else 'end'
+    if expect in ('key', 'key_or_close'):
+        return 'colon' if tok[0] == '"' else None
+    if expect == 'colon':
+        return 'value' if tok == ':' else None
+    if expect == 'comma_or_close':
+        if tok != ',':
+            return None
+        return 'key' if stack[-1] == '{' else 'value'
+    if expect in ('value', 'value_or_close'):
+        if tok in ('{', '['):
+            stack.append(tok)
+            return 'key_or_close' if tok == '{' else 'value_or_close'
+        if tok[0] == '"' or _JSON_SCALAR_RE.fullmatch(tok):
+            return 'comma_or_close' if stack else 'end'
+    return None
+
+def json_preview(chunks, limit: int = PREVIEW_CHARS):
+    """Re-indent a JSON text stream like json.dumps(indent=2), stopping after `limit` output chars.
+
+    Returns (preview, complete); only as much of the stream as the preview needs is read.
+    Tokens are checked against the JSON grammar as they are read; on the first invalid one
+    (or a truncated document) the text is shown verbatim via `read_preview` instead.
+    """
+    out = []
+    size = 0
+    depth = 0
+    after_open = False
+    stack = []
+    expect = 'value'
+    buf = ''
+    pos = 0
+    chunks = iter(chunks)
+    seen = []  # raw chunks kept for the verbatim fallback, which needs at most `limit` chars
+    seen_size = 0
+    eof = False
+    while size < limit:
+        m = _JSON_TOKEN_RE.match(buf, pos)
+        if m is None or (not eof and m.end() == len(buf) and m.group() not in ('{', '}', '[', ']', ',', ':')):
+            if eof:
+                if pos < len(buf) or expect != 'end':  # not JSON after all
+                    return read_preview(seen, limit)
+                break
+            chunk = next(chunks, None)
+            if chunk is None:
+                eof = True
+            else:
+                if seen_size <= limit:
+                    seen.append(chunk)
+                    seen_size += len(chunk)
+                buf = buf[pos:] + chunk
+                pos = 0
+            continue
+        tok = m.group()
+        pos = m.end()
+        if tok.isspace():
+            continue
+        expect = _json_grammar_step(stack, expect, tok)
+        if expect is None:
+            return read_preview(itertools.chain(seen, chunks), limit)
+        if tok in ('}', ']'):
+            depth -= 1
+            piece = tok if after_open else '\n' + '  ' * depth + tok
+            after_open = False
+        else:
+            piece = '\n' + '  ' * depth if after_open else ''
+            after_open = False
+            if tok in ('{', '['):
+                piece += tok
+                depth += 1
+                after_open = True
+            elif tok == ',':
+                piece += ',\n' + '  ' * depth
+            elif tok == ':':
+                piece += ': '
+            else:
+                piece += tok
+        out.append(piece)
+        size += len(piece)
+    preview = ''.join(out)
+    complete = eof and pos >= len(buf) and size <= limit
+    return (preview if complete else preview[:limit], complete)
+
+def read_preview(chunks, limit: int = PREVIEW_CHARS):
+    """Read at most `limit` characters from a text stream; return (preview, complete)."""
+    parts = []
+    size = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return (''.join(parts)[:limit], False)
+    return (''.join(parts), True)
+
+class JsonStreamReader:
+    """Pull-based reader that decodes one JSON value at a time from a stream of text chunks."""
+    __slots__ = ('_chunks', 'buf', 'pos', 'eof')
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, min_chars: int = 1) -> bool:
+        """Append at least `min_chars` more characters; return False once the stream is exhausted."""
+        if self.eof:
+            return False
+        parts = [self.buf[self.pos:]]
+        added = 0
+        while added < min_chars:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.eof = True
+                break
+            parts.append(chunk)
+            added += len(chunk)
+        self.buf = ''.join(parts)
+        self.pos = 0
+        return added > 0
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise ValueError(f"Expected {ch!r} at offset {self.pos} of JSON stream")
+        self.pos += 1
+
+    def skip_comma(self):
+        if self.peek() == ',':
+            self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                val, end = _JSON_DECODER.raw_decode(self.buf, self.pos)
+            except ValueError:
+                # grow the buffer geometrically so large values are not re-parsed chunk by chunk
+                if not self._fill(max(len(self.buf) - self.pos, STREAM_CHUNK_BYTES)):
+                    raise
+                continue
+            if end == len(self.buf) and self._fill():  # a number may continue in the next chunk
+                continue
+            self.pos = end
+            return val
+
+def iter_json_path_stream(chunks, expr: str):
+    """Yield values matched by a JSON path while reading the document incrementally.
+
+    Leading .key / [n] steps are walked in the stream and the first wildcard is iterated
+    item by item, so only one record is held in memory at a time. Remaining steps are
+    evaluated on each item with `json_path_values`.
+    """
+    steps = compile_json_path(expr)
+    reader = JsonStreamReader(chunks)
+    for i, (kind, key) in enumerate(steps):
+        rest = steps[i + 1:]
+        if kind == 'descend' or (kind == 'index' and key < 0):
+            yield from json_path_values(reader.value(), steps[i:])
+            return
+        if kind == 'child' and key == '*':
+            opener = reader.peek()
+            if opener not in ('[', '{'):
+                return
+            closer = ']' if opener == '[' else '}'
+            reader.expect(opener)
+            while reader.peek() != closer:
+                if opener == '{':
+                    reader.value()
+                    reader.expect(':')
+                yield from json_path_values(reader.value(), rest)
+                reader.skip_comma()
+            return
+        if kind == 'index':
+            if reader.peek() != '[':
+                return
+            reader.expect('[')
+            idx = 0
+            while reader.peek() not in (']', ''):
+                if idx == key:
+                    break
+                reader.value()
+                reader.skip_comma()
+                idx += 1
+            else:
+                return
+            continue
+        if reader.peek() != '{':
+            return
+        reader.expect('{')
+        while True:
+            if reader.peek() in ('}', ''):
+                return
+            name = reader.value()
+            reader.expect(':')
+            if name == key:
+                break
+            reader.value()
+            reader.skip_comma()
+    yield reader.value()
+
+def record_to_row(record) -> dict:
+    """Flatten one JSON record into a {column: text} mapping for tabular export."""
+    if not isinstance(record, dict):
+        record = {'value': record}
+    return {str(k): v if isinstance(v, str) else json.dumps(v, ensure_ascii=False) for k, v in record.items()}
+
+# Deduplication keyed on fixed-size row fingerprints instead of tuples of cell strings
+DEDUP_MAX_EXACT = 1_000_000
+DEDUP_ERROR_RATE = 1e-4
+SEEN_ROWS_PATH = os.environ.get("SCRAPER_SEEN_DB", "scraper_seen.db")
+
+def row_fingerprint(row) -> int:
+    """Stable signed 64-bit fingerprint of a row (same value in every process and run)."""
+    cells = ("" if c is None else str(c) for c in row)
+    # length-prefix each cell so no separator character can make two rows collide
+    data = ''.join(f"{len(c)}:{c}" for c in cells).encode('utf-8', errors='surrogatepass')
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big', signed=True)
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit fingerprints, sized for `capacity` entries."""
+    __slots__ = ('_bits', '_size', '_hashes', 'capacity')
+
+    def __init__(self, capacity: int, error_rate: float = DEDUP_ERROR_RATE):
+        self.capacity = capacity
+        self._size = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, fp: int):
+        h1, h2 = (fp >> 32) & 0xFFFFFFFF, (fp & 0xFFFFFFFF) | 1
+        for i in range(self._hashes):
+            pos = (h1 + i * h2) % self._size
+            yield pos >> 3, 1 << (pos & 7)
+
+    def __contains__(self, fp: int) -> bool:
+        return all(self._bits[byte] & bit for byte, bit in self._positions(fp))
+
+    def add(self, fp: int) -> bool:
+        """Set the bits for `fp`; return True if it was (probably) not present before."""
+        new = False
+        for byte, bit in self._positions(fp):
+            if not self._bits[byte] & bit:
+                self._bits[byte] |= bit
+                new = True
+        return new
+
+class RowDeduper:
+    """Streaming duplicate filter for rows.
+
+    Keeps an exact set of 64-bit fingerprints and, past `max_exact` entries, switches to
+    Bloom filters so memory grows by a few bytes per row instead. When a filter reaches its
+    capacity a larger one with half the error rate is added (a scalable Bloom filter), so
+    the chance of dropping a distinct row as a false duplicate stays below `error_rate`.
+    """
+    __slots__ = ('_seen', '_blooms', '_bloom_count', '_max_exact', '_error_rate')
+
+    def __init__(self, max_exact: int = DEDUP_MAX_EXACT, error_rate: float = DEDUP_ERROR_RATE):
+        self._seen = set()
+        self._blooms = []
+        self._bloom_count = 0
+        self._max_exact = max_exact
+        self._error_rate = error_rate
+
+    def add(self, row) -> bool:
+        """Record `row`; return True the first time it is seen."""
+        fp = row_fingerprint(row)
+        if self._seen is None:
+            return self._add_bloom(fp)
+        if fp in self._seen:
+            return False
+        self._seen.add(fp)
+        if len(self._seen) > self._max_exact:
+            seen, self._seen = self._seen, None
+            for fp in seen:
+                self._add_bloom(fp)
+        return True
+
+    def _add_bloom(self, fp: int) -> bool:
+        if any(fp in bloom for bloom in self._blooms):
+            return False
+        if not self._blooms or self._bloom_count >= self._blooms[-1].capacity:
+            k = len(self._blooms)
+            self._blooms.append(BloomFilter(10 * self._max_exact * 2 ** k, self._error_rate / 2 ** (k + 1)))
+            self._bloom_count = 0
+        self._blooms[-1].add(fp)
+        self._bloom_count += 1
+        return True
+
+    def filter(self, rows):
+        """Yield rows from `rows` that were not seen before."""
+        for row in rows:
+            if self.add(row):
+                yield row
+
+class SeenRowsStore:
+    """Fingerprints of rows already returned for a target, kept across runs in SQLite."""
+
+    def __init__(self, path: str = SEEN_ROWS_PATH, batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS seen_rows (target TEXT NOT NULL, fp INTEGER NOT NULL, "
+                         "PRIMARY KEY (target, fp)) WITHOUT ROWID")
+
+    def filter_new(self, target: str, rows, fingerprints=None):
+        """Yield the rows of `rows` not returned by earlier runs for `target`.
+
+        Only reads the store: the fingerprints of yielded rows are appended to `fingerprints`
+        (if given) and must be passed to `remember` once the result has been persisted, so a
+        run that fails or loses its lease doesn't hide rows from its retry.
+        """
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            it = iter(rows)
+            while True:
+                batch = list(itertools.islice(it, self.batch_size))
+                if not batch:
+                    break
+                fps = [row_fingerprint(r) for r in batch]
+                marks = ','.join('?' * len(fps))
+                known = {fp for (fp,) in conn.execute(f"SELECT fp FROM seen_rows WHERE target = ? AND fp IN ({marks})", (target, *fps))}
+                for fp, row in zip(fps, batch):
+                    if fp not in known:
+                        known.add(fp)
+                        if fingerprints is not None:
+                            fingerprints.append(fp)
+                        yield row
+
+    def remember(self, target: str, fingerprints):
+        """Mark `fingerprints` (from `filter_new`) as returned for `target`."""
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.executemany("INSERT OR IGNORE INTO seen_rows (target, fp) VALUES (?, ?)", ((target, fp) for fp in fingerprints))
+
+def remember_seen_rows(stats: dict):
+    """Record a skip-seen task's rows as seen; call only after its result was persisted."""
+    if stats.get("seen_rows"):
+        target, fingerprints = stats["seen_rows"]
+        SeenRowsStore(SEEN_ROWS_PATH).remember(target, fingerprints)
+
 def is_valid_url(url: str) -> bool:
     try:
         p = urlparse(url)
@@ -546,6 +1376,7 @@ def is_valid_url(url: str) -> bool:
 
 def fetch_data(url: str, user_agent: str = None, timeout: int = 10, headers_only: bool = False, method: str = 'GET', custom_headers: dict = None, post_data: dict = None):
     """Fetch content; return tuple (content_text_or_bytes, content_type, headers_dict)."""
+    import requests
     headers = {"User-Agent": user_agent or "Mozilla/5.0 (compatible; EnhancedScraper/1.0)"}
     if custom_headers:
         headers.update(custom_headers)
@@ -559,38 +1390,193 @@ def fetch_data(url: str, user_agent: str = None, timeout: int = 10, headers_only
     if headers_only:
         return (json.dumps(resp_headers, indent=2), resp_headers.get("Content-Type", "text/plain"), resp_headers)
 
+    content_type = resp_headers.get("Content-Type", "")
+    text = decode_body(resp.content, content_type, urlparse(url).netloc)
+    return (text, content_type, resp_headers)
+
+def fetch_stream(url: str, user_agent: str = None, timeout: int = 10, method: str = 'GET', custom_headers: dict = None, post_data: dict = None):
+    """Open a streaming request; return tuple (text_chunk_iterator, content_type, headers_dict).
+
+    The body is decoded incrementally; the response is closed when the iterator is
+    exhausted or closed, so callers may stop reading early.
+    """
+    import requests
+    headers = {"User-Agent": user_agent or "Mozilla/5.0 (compatible; EnhancedScraper/1.0)"}
+    if custom_headers:
+        headers.update(custom_headers)
+    resp = requests.request(method, url, headers=headers, timeout=timeout, json=post_data, allow_redirects=True, stream=True)
     try:
-        text = resp.text
+        resp.raise_for_status()
     except Exception:
+        resp.close()
+        raise
+    resp_headers = dict(resp.headers)
+    content_type = resp_headers.get("Content-Type", "")
+
+    def chunks():
         try:
-            text = resp.content.decode('utf-8', errors='replace')
-        except Exception:
-            text = str(resp.content)
+            decoder = None
+            for raw in resp.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                if not raw:
+                    continue
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder(detect_encoding(raw, content_type, urlparse(url).netloc, partial=True))(errors='replace')
+                yield decoder.decode(raw)
+            if decoder is not None:
+                tail = decoder.decode(b'', final=True)
+                if tail:
+                    yield tail
+        finally:
+            resp.close()
 
-    return (text, resp_headers.get("Content-Type", ""), resp_headers)
+    return (chunks(), content_type, resp_headers)
 
 def clean_text(text: str) -> str:
     if not text:
         return ""
     return re.sub(r'\s+', ' ', text.strip())
 
+# AutoFind link ranking: weight of the strongest keyword in the href, plus bonuses in find_contact_links
+AUTOFIND_MAX_PAGES = 10
+CONTACT_KEYWORDS = {
+    'contact-us': 12, 'contactus': 12, 'contact': 10,
+    'inquiry': 6, 'customer-service': 6, 'support': 4, 'about': 2,
+}
+_CONTACT_KEYWORD_RE = re.compile('|'.join(re.escape(k) for k in sorted(CONTACT_KEYWORDS, key=len, reverse=True)))
+
 def extract_emails(text: str):
     return re.findall(REGEX_PRESETS['email'], text or '', flags=re.IGNORECASE)
 
-def find_contact_links(soup: BeautifulSoup, base_url: str):
-    """Return absolute URLs for links that likely point to contact pages."""
-    candidates = []
-    for a in soup.find_all('a', href=True):
-        href = a['href'].strip()
-        low = href.lower()
-        if any(k in low for k in ('contact', 'support', 'about', 'customer-service', 'inquiry', 'contact-us', 'contactus')):
-            absolute = urljoin(base_url, href)
-            candidates.append((absolute, a.get_text(strip=True) or href))
-    seen = set(); out = []
-    for u, text in candidates:
-        if u not in seen:
-            seen.add(u); out.append((u, text))
-    return out
+def apply_text_filters(txt: str, clean: bool = False, regex_pattern: str = "") -> str:
+    if clean:
+        txt = clean_text(txt)
+    if regex_pattern:
+        matches = re.findall(regex_pattern, txt, flags=re.DOTALL)
+        txt = ', '.join(m if isinstance(m, str) else m[0] for m in matches) if matches else ''
+    return txt
+
+def extract_rows(html: str, selectors=(), json_paths=(), regex_pattern: str = "", clean: bool = False):
+    """Run scrape-mode extraction on one document; return rows as lists of str.
+
+    Module-level and free of soup objects in its result so it can run in the extraction pool.
+    """
+    lists_by_selector = []
+    max_len = 0
+
+    if json_paths:
+        blobs = [data for _, data in extract_embedded_json(html)]
+        for path in json_paths:
+            texts = []
+            for blob in blobs:
+                for value in json_path_values(blob, path):
+                    txt = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+                    texts.append(apply_text_filters(txt, clean, regex_pattern))
+            lists_by_selector.append(texts[:100])
+            if len(texts) > max_len:
+                max_len = len(texts)
+    elif selectors:
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html, "html.parser")
+        for sel in selectors:
+            els = soup.select(sel)
+            texts = []
+            for el in els:
+                txt = el.get_text(separator=' ', strip=True) or next((el.get(a) for a in ["alt", "title", "src", "href"] if el.get(a)), "")
+                texts.append(apply_text_filters(txt, clean, regex_pattern))
+            lists_by_selector.append(texts[:100])
+            if len(texts) > max_len:
+                max_len = len(texts)
+    else:
+        matches = re.findall(regex_pattern, html, flags=re.DOTALL) if regex_pattern else []
+        normalized = [m[0] if isinstance(m, tuple) else m for m in matches][:100]
+        lists_by_selector = [[match] for match in normalized]
+        max_len = len(lists_by_selector)
+
+    rows = []
+    for i in range(max_len):
+        row = [lst[i] if i < len(lst) else "" for lst in lists_by_selector]
+        rows.append(row)
+    return rows
+
+def extract_page_emails(html: str):
+    """Emails on a contact page, falling back to mailto: links when the text has none."""
+    emails = extract_emails(html)
+    if not emails:
+        from bs4 import BeautifulSoup
+        for a in BeautifulSoup(html, 'html.parser').select('a[href^="mailto:"]'):
+            mail = a.get('href').split(':', 1)[1] if ':' in a.get('href') else a.get('href')
+            if mail:
+                emails.append(mail)
+    return emails
+
+class ContactLinkParser(HTMLParser):
+    """Tokenizer-only collector of (href, text) for anchors whose href has a contact keyword.
+
+    Text is gathered until the next <a> start or </a>, so unclosed anchors cannot swallow
+    their neighbours; no tree is built.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+        self._href = None
+        self._text = []
+
+    def _close_anchor(self):
+        if self._href is not None:
+            self.links.append((self._href, ''.join(self._text)))
+        self._href = None
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'a':
+            return
+        self._close_anchor()
+        href = next((v for k, v in attrs if k == 'href' and v), None)
+        if href and _CONTACT_KEYWORD_RE.search(href.lower()):
+            self._href = href.strip()
+
+    def handle_endtag(self, tag):
+        if tag == 'a':
+            self._close_anchor()
+
+    def handle_data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+
+    def close(self):
+        super().close()
+        self._close_anchor()
+
+def find_contact_links(html: str, base_url: str, limit: int = AUTOFIND_MAX_PAGES):
+    """Return up to `limit` (absolute_url, link_text) pairs that likely point to contact pages, best first.
+
+    Anchors come from the stdlib HTML tokenizer instead of a parsed DOM, and the keyword check
+    is a single compiled alternation, so huge mega-menu homepages stay cheap.
+    """
+    parser = ContactLinkParser()
+    parser.feed(html)
+    parser.close()
+
+    base_host = urlparse(base_url).netloc
+    best = {}
+    for href, raw_text in parser.links:
+        hits = _CONTACT_KEYWORD_RE.findall(href.lower())
+        absolute = urljoin(base_url, href)
+        parsed = urlparse(absolute)
+        if parsed.scheme not in ("http", "https"):
+            continue
+        text = clean_text(raw_text)
+        score = max(CONTACT_KEYWORDS[h] for h in hits)
+        if _CONTACT_KEYWORD_RE.search(text.lower()):
+            score += 3
+        if parsed.netloc == base_host:
+            score += 1
+        score -= 0.5 * parsed.path.strip('/').count('/')
+        if absolute not in best or score > best[absolute][0]:
+            best[absolute] = (score, text or href)
+    ranked = sorted(best.items(), key=lambda item: -item[1][0])
+    return [(u, text) for u, (score, text) in ranked[:limit]]
 
 @app.route("/", methods=["GET", "POST"])
 def index():
@@ -601,163 +1587,439 @@ def index():
         return redirect(url_for("process"))
     return render_template_string(TEMPLATE, results=False, request=request, theme=theme, history=session.get('history', []))
 
-@app.route("/process", methods=["POST"])
-def process():
-    global _LAST_RESULTS
-    url = request.form.get("url", "").strip()
-    mode = request.form.get("mode", "curl")  # Preserve mode from form
-    theme = request.form.get("theme", "light")
-    user_agent = request.form.get("user_agent", "").strip() or None
+def is_request_error(exc: Exception) -> bool:
+    """True for requests' network/HTTP errors, without importing requests just to check."""
+    requests = sys.modules.get("requests")
+    return requests is not None and isinstance(exc, requests.exceptions.RequestException)
+
+def task_from_form(form) -> dict:
+    """Validate scrape/curl form fields into a task dict; raise ValueError with a user-facing message."""
+    url = str(form.get("url", "")).strip()
+    mode = form.get("mode", "curl")
     try:
-        timeout = int(request.form.get("timeout", 10))
-    except ValueError:
+        timeout = int(form.get("timeout", 10))
+    except (TypeError, ValueError):
         timeout = 10
-    fmt = request.form.get("format", "csv")
-    headers_only = bool(request.form.get("headers_only"))
-    unique = bool(request.form.get("unique"))
-    clean_data_flag = bool(request.form.get("clean_data"))
-    post_method = bool(request.form.get("post_method"))
-    custom_headers_raw = request.form.get("custom_headers", "").strip()
-    post_data_raw = request.form.get("post_data", "").strip()
-    selectors_raw = request.form.get("selectors", "").strip() if mode == "scrape" else ""
-    regex_pattern = request.form.get("regex_pattern", "").strip() if mode == "scrape" else ""
-    autofind = request.form.get('autofind', '0') == '1'
+    selectors_raw = str(form.get("selectors", "")).strip() if mode == "scrape" else ""
+    regex_pattern = str(form.get("regex_pattern", "")).strip() if mode == "scrape" else ""
+    json_paths_raw = str(form.get("json_paths", "")).strip() if mode == "scrape" else ""
+    json_filter = str(form.get("json_filter", "")).strip() if mode == "curl" else ""
+    autofind = str(form.get('autofind', '0')) in ('1', 'True', 'true')
+    custom_headers_raw = str(form.get("custom_headers", "")).strip()
+    post_data_raw = str(form.get("post_data", "")).strip()
 
     if not is_valid_url(url):
-        flash("Invalid URL.", "error")
-        return redirect(url_for("index"))
-    if mode == "scrape" and not selectors_raw and not regex_pattern and not autofind:
-        flash("Enter CSS selectors or regex for scrape mode (or use Auto Find).", "error")
-        return redirect(url_for("index"))
+        raise ValueError("Invalid URL.")
+    if mode == "scrape" and not selectors_raw and not regex_pattern and not json_paths_raw and not autofind:
+        raise ValueError("Enter CSS selectors, regex or JSON paths for scrape mode (or use Auto Find).")
     if timeout < 1 or timeout > 120:
-        flash("Timeout 1-120s.", "error")
-        return redirect(url_for("index"))
-
+        raise ValueError("Timeout 1-120s.")
     try:
         custom_headers = json.loads(custom_headers_raw) if custom_headers_raw else {}
     except json.JSONDecodeError:
-        flash("Invalid JSON in custom headers.", "error")
-        return redirect(url_for("index"))
-
+        raise ValueError("Invalid JSON in custom headers.")
     try:
         post_data = json.loads(post_data_raw) if post_data_raw else None
     except json.JSONDecodeError:
-        flash("Invalid JSON in POST data.", "error")
-        return redirect(url_for("index"))
+        raise ValueError("Invalid JSON in POST data.")
 
-    try:
-        method = 'POST' if post_method else 'GET'
+    return {
+        "url": url,
+        "mode": "autofind" if autofind else mode,
+        "user_agent": str(form.get("user_agent", "")).strip() or None,
+        "timeout": timeout,
+        "method": 'POST' if form.get("post_method") else 'GET',
+        "custom_headers": custom_headers,
+        "post_data": post_data,
+        "headers_only": bool(form.get("headers_only")),
+        "selectors": [s.strip() for s in selectors_raw.split(",") if s.strip()],
+        "json_paths": [p.strip() for p in json_paths_raw.split(",") if p.strip()],
+        "json_filter": json_filter,
+        "regex_pattern": regex_pattern,
+        "unique": bool(form.get("unique")),
+        "skip_seen": bool(form.get("skip_seen")),
+        "clean": bool(form.get("clean_data")),
+    }
+
+def is_tabular_task(task: dict) -> bool:
+    """True for tasks that produce rows (scrape, Auto Find, filtered curl) rather than a raw preview."""
+    return task["mode"] in ("scrape", "autofind") or bool(task.get("json_filter")) and not task.get("headers_only")
+
+def run_task(task: dict, heartbeat=None):
+    """Fetch and extract one tabular task; return (RowStore, stats).
+
+    Shared by /process and the queue workers, so a task behaves the same wherever it runs.
+    `heartbeat`, if given, is called before every fetch and periodically while streaming so
+    a queue worker can keep its lease alive on long tasks. With skip_seen, the caller passes
+    `stats` to `remember_seen_rows` once the rows have been delivered or stored.
+    """
+    beat = heartbeat or (lambda: None)
+    url = task["url"]
+    user_agent, timeout, method = task.get("user_agent"), task.get("timeout", 10), task.get("method", "GET")
+    custom_headers, post_data = task.get("custom_headers") or {}, task.get("post_data")
+    stats = {}
 
-        if autofind:
-            home_html, home_ctype, home_headers = fetch_data(url, user_agent, timeout, False, method, custom_headers, post_data)
-            soup = BeautifulSoup(home_html, 'html.parser')
-            contact_links = find_contact_links(soup, url)
+    beat()
+    if task["mode"] == "autofind":
+        home_html, home_ctype, home_headers = fetch_data(url, user_agent, timeout, False, method, custom_headers, post_data)
+        contact_links = find_contact_links(home_html, url)
+        stats["contact_candidates"] = len(contact_links)
 
-            results_rows = []
-            visited = set()
-            emails_home = extract_emails(home_html)
-            for e in emails_home:
-                results_rows.append([url, 'homepage', e])
-                visited.add((url, e))
+        store = RowStore(['source_url', 'link_text', 'email'])
+        visited = RowDeduper()
+        emails_home = extract_emails(home_html)
+        for e in emails_home:
+            if visited.add((url, e)):
+                store.append([url, 'homepage', e])
 
+        def contact_pages():
             for link, text in contact_links:
+                beat()
                 try:
-                    if link in visited:
-                        continue
                     page_html, _, _ = fetch_data(link, user_agent, timeout, False, method, custom_headers, post_data)
-                    emails = extract_emails(page_html)
-                    if not emails:
-                        for a in BeautifulSoup(page_html, 'html.parser').select('a[href^="mailto:"]'):
-                            mail = a.get('href').split(':', 1)[1] if ':' in a.get('href') else a.get('href')
-                            if mail:
-                                emails.append(mail)
-                    for e in emails:
-                        if (link, e) not in visited:
-                            results_rows.append([link, text, e])
-                            visited.add((link, e))
                 except Exception:
                     continue
+                yield (link, text), (page_html,)
 
-            df = pd.DataFrame(results_rows, columns=['source_url', 'link_text', 'email']) if results_rows else pd.DataFrame(columns=['source_url', 'link_text', 'email'])
-            table_html = df.head(200).to_html(classes="table table-striped table-hover", index=False, escape=False)
-            results = {"table_html": table_html, "mode": "autofind", "rows": df.values.tolist(), "columns": df.columns.tolist()}
-            metadata = f"AutoFind run: {datetime.now().isoformat()}\nHome: {url}\nContact candidates: {len(contact_links)}\nEmails found: {len(df)}"
+        # pages are parsed in the pool while the next ones are being fetched
+        for (link, text), emails in bounded_map(extract_page_emails, contact_pages()):
+            for e in emails or []:
+                if visited.add((link, e)):
+                    store.append([link, text, e])
 
-        elif mode == "curl":
-            content, ctype, headers = fetch_data(url, user_agent, timeout, headers_only, method, custom_headers, post_data)
-            raw_preview = None
-            try:
-                parsed = json.loads(content)
-                raw_preview = json.dumps(parsed, indent=2)
-            except Exception:
-                raw_preview = content if isinstance(content, str) else str(content)
-
-            results = {"raw_content": raw_preview if len(str(raw_preview)) < 10000 else str(raw_preview)[:10000] + '...', "mode": "curl", "headers": headers}
-            metadata = f"Fetched ({method}): {datetime.now().isoformat()}\nContent-Type: {ctype}\nLength: {len(raw_preview)}"
-
-        else:  # scrape
-            html, ctype, headers = fetch_data(url, user_agent, timeout, False, method, custom_headers, post_data)
-            soup = BeautifulSoup(html, "html.parser")
-            selectors = [s.strip() for s in selectors_raw.split(",") if s.strip()] if selectors_raw else []
-
-            lists_by_selector = []
-            max_len = 0
-
-            if selectors:
-                for sel in selectors:
-                    els = soup.select(sel)
-                    texts = []
-                    for el in els:
-                        txt = el.get_text(separator=' ', strip=True) or next((el.get(a) for a in ["alt", "title", "src", "href"] if el.get(a)), "")
-                        if clean_data_flag:
-                            txt = clean_text(txt)
-                        if regex_pattern:
-                            matches = re.findall(regex_pattern, txt, flags=re.DOTALL)
-                            if matches:
-                                txt = ', '.join(matches)
-                            else:
-                                txt = ''
-                        texts.append(txt)
-                    lists_by_selector.append(texts[:100])
-                    if len(texts) > max_len:
-                        max_len = len(texts)
-            else:
-                matches = re.findall(regex_pattern, html, flags=re.DOTALL) if regex_pattern else []
-                normalized = [m[0] if isinstance(m, tuple) else m for m in matches][:100]
-                lists_by_selector = [[match] for match in normalized]
-                max_len = len(lists_by_selector)
+    elif task["mode"] == "curl":
+        chunks, ctype, headers = fetch_stream(url, user_agent, timeout, method, custom_headers, post_data)
+        stats["content_type"] = ctype
+        store = RowStore([])
+        try:
+            dedup = RowDeduper() if task.get("unique") else None
+            for i, record in enumerate(iter_json_path_stream(chunks, task["json_filter"]), 1):
+                row = record_to_row(record)
+                # key order doesn't make two records different
+                if dedup is None or dedup.add(itertools.chain.from_iterable(sorted(row.items()))):
+                    store.append_dict(row)
+                if i % 10000 == 0:
+                    beat()
+        finally:
+            chunks.close()
+
+    else:  # scrape
+        html, ctype, headers = fetch_data(url, user_agent, timeout, False, method, custom_headers, post_data)
+        selectors, json_paths = task.get("selectors") or [], task.get("json_paths") or []
+        rows = run_extraction(extract_rows, html, selectors, json_paths, task.get("regex_pattern", ""), task.get("clean", False))
+        if json_paths:
+            selectors = json_paths
+
+        if task.get("unique"):
+            rows = list(RowDeduper().filter(rows))
 
-            rows = []
-            for i in range(max_len):
-                row = [lst[i] if i < len(lst) else "" for lst in lists_by_selector]
-                rows.append(row)
+        columns = [f"{s[:20]}..." if len(s) > 20 else s for s in selectors] or ["regex_match"]
+        if rows and len(columns) != len(rows[0]):
+            columns = [f"Column_{i+1}" for i in range(len(rows[0]))]
+        store = RowStore(columns, rows)
 
-            if unique:
-                rows = list({tuple(r): r for r in rows}.values())
+    if task.get("skip_seen"):
+        target, fingerprints = f"{task['mode']}:{url}", array('q')
+        store = RowStore(store.columns, SeenRowsStore(SEEN_ROWS_PATH).filter_new(target, store, fingerprints))
+        stats["seen_rows"] = (target, fingerprints)  # see remember_seen_rows
+    return store.freeze(), stats
 
-            columns = [f"{s[:20]}..." if len(s) > 20 else s for s in selectors] or ["regex_match"]
-            if rows and len(columns) != len(rows[0]):
-                columns = [f"Column_{i+1}" for i in range(len(rows[0]))]
+@app.route("/process", methods=["POST"])
+def process():
+    global _LAST_RESULTS
+    theme = request.form.get("theme", "light")
+    fmt = request.form.get("format", "csv")
+    try:
+        task = task_from_form(request.form)
+    except ValueError as e:
+        flash(str(e), "error")
+        return redirect(url_for("index"))
+    url, mode, method = task["url"], task["mode"], task["method"]
 
-            df = pd.DataFrame(rows, columns=columns) if rows else pd.DataFrame(columns=columns)
-            table_html = df.head(100).to_html(classes="table table-striped table-hover", index=False, escape=False)
-            results = {"table_html": table_html, "mode": "scrape", "rows": rows, "columns": columns}
-            metadata = f"Scraped ({method}): {datetime.now().isoformat()}\nSelectors/Regex: {selectors_raw or regex_pattern}\nRows: {len(rows)}\nUnique: {unique}\nClean: {clean_data_flag}"
+    try:
+        if is_tabular_task(task):
+            store, stats = run_task(task)
+            table_html = render_table(store, 200 if mode == "autofind" else 100) if store.columns else None
+            results = {"mode": mode, "rows": store, "columns": store.columns}
+            if mode == "autofind":
+                metadata = f"AutoFind run: {datetime.now().isoformat()}\nHome: {url}\nContact candidates: {stats['contact_candidates']}\nEmails found: {len(store)}"
+            elif mode == "curl":
+                metadata = f"Fetched ({method}): {datetime.now().isoformat()}\nContent-Type: {stats['content_type']}\nJSON filter: {task['json_filter']}\nRecords: {len(store)}\nUnique: {task['unique']}"
+            else:
+                extraction = ', '.join(task["json_paths"] or task["selectors"]) or task["regex_pattern"]
+                metadata = f"Scraped ({method}): {datetime.now().isoformat()}\nSelectors/Regex: {extraction}\nRows: {len(store)}\nUnique: {task['unique']}\nSkip seen: {task['skip_seen']}\nClean: {task['clean']}"
+
+        else:  # curl preview
+            table_html = None
+            if task["headers_only"]:
+                raw_preview, ctype, headers = fetch_data(url, task["user_agent"], task["timeout"], True, method, task["custom_headers"], task["post_data"])
+                complete = True
+            else:
+                chunks, ctype, headers = fetch_stream(url, task["user_agent"], task["timeout"], method, task["custom_headers"], task["post_data"])
+                try:
+                    head = next(chunks, '')
+                    body = itertools.chain([head], chunks)
+                    if 'json' in ctype.lower() or head.lstrip()[:1] in ('{', '['):
+                        raw_preview, complete = json_preview(body)
+                    else:
+                        raw_preview, complete = read_preview(body)
+                finally:
+                    chunks.close()
+
+            length = len(raw_preview) if complete else headers.get("Content-Length", f"> {PREVIEW_CHARS} chars (streamed)")
+            results = {"raw_content": raw_preview if complete else raw_preview + '...', "mode": "curl", "headers": headers}
+            metadata = f"Fetched ({method}): {datetime.now().isoformat()}\nContent-Type: {ctype}\nLength: {length}"
 
         _LAST_RESULTS = {"results": results, "url": url, "mode": mode, "format": fmt, "metadata": metadata}
-        session['history'].append({"url": url, "mode": mode, "time": datetime.now().strftime("%Y-%m-%d %H:%M")})
+        session.setdefault('history', []).append({"url": url, "mode": mode, "time": datetime.now().strftime("%Y-%m-%d %H:%M")})
         session.modified = True
-        return render_template_string(TEMPLATE, results=True, table_html=results.get("table_html"), raw_content=results.get("raw_content"), metadata=metadata, request=request, theme=theme, history=session.get('history', []))
+        page = render_template_string(TEMPLATE, results=True, table_html=table_html, raw_content=results.get("raw_content"), metadata=metadata, request=request, theme=theme, history=session.get('history', []))
+        if is_tabular_task(task):
+            remember_seen_rows(stats)
+        return page
 
-    except requests.exceptions.RequestException as rexc:
-        traceback.print_exc()
-        flash(f"Request error: {str(rexc)}", "error")
-        return redirect(url_for("index"))
     except Exception as e:
         traceback.print_exc()
-        flash(f"Error: {str(e)}", "error")
+        flash(f"Request error: {str(e)}" if is_request_error(e) else f"Error: {str(e)}", "error")
         return redirect(url_for("index"))
 
+# Task queue: the web app enqueues tasks, `python app.py worker` processes on the same host pull them from a shared SQLite file
+TASK_QUEUE_PATH = os.environ.get("SCRAPER_QUEUE_DB", "scraper_queue.db")
+_TASK_QUEUE = None
+
+class TaskQueue:
+    """SQLite-backed task queue and result store shared by the web app and scrape workers.
+
+    Workers claim tasks under a time-limited lease that they renew with `heartbeat` while a
+    task runs; a task whose lease expires (crashed or stuck worker) is handed to another
+    worker, and failed tasks are retried until `max_attempts` is reached. Results are
+    written only by the worker holding the lease.
+
+    The file uses WAL mode, whose index lives in shared memory, so all processes must run on
+    one host; do not put the queue on a network filesystem.
+    """
+
+    def __init__(self, path: str = TASK_QUEUE_PATH, lease_seconds: int = 300, max_attempts: int = 3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    worker TEXT,
+                    lease_until REAL,
+                    error TEXT,
+                    columns TEXT,
+                    row_count INTEGER,
+                    created REAL NOT NULL,
+                    updated REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, id);
+                CREATE TABLE IF NOT EXISTS task_rows (
+                    task_id INTEGER NOT NULL,
+                    seq INTEGER NOT NULL,
+                    row TEXT NOT NULL,
+                    PRIMARY KEY (task_id, seq)
+                );
+            """)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def enqueue(self, task: dict) -> int:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            cur = conn.execute("INSERT INTO tasks (task, created, updated) VALUES (?, ?, ?)", (json.dumps(task), now, now))
+            return cur.lastrowid
+
+    def claim(self, worker_id: str):
+        """Lease the oldest runnable task to `worker_id`; return (task_id, task) or None."""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("UPDATE tasks SET status = 'failed', error = COALESCE(error, 'lease expired'), updated = ? "
+                             "WHERE status = 'running' AND lease_until < ? AND attempts >= ?", (now, now, self.max_attempts))
+                row = conn.execute("SELECT id, task FROM tasks WHERE status = 'queued' OR (status = 'running' AND lease_until < ?) "
+                                   "ORDER BY id LIMIT 1", (now,)).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE tasks SET status = 'running', worker = ?, lease_until = ?, attempts = attempts + 1, updated = ? "
+                                 "WHERE id = ?", (worker_id, now + self.lease_seconds, now, row[0]))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return (row[0], json.loads(row[1])) if row else None
+
+    def heartbeat(self, task_id: int, worker_id: str) -> bool:
+        """Extend the lease on a running task; return False if `worker_id` no longer holds it."""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            cur = conn.execute("UPDATE tasks SET lease_until = ?, updated = ? WHERE id = ? AND status = 'running' AND worker = ?",
+                               (now + self.lease_seconds, now, task_id, worker_id))
+        return cur.rowcount > 0
+
+    def complete(self, task_id: int, worker_id: str, store) -> bool:
+        """Store the result rows for a leased task; return False if the lease was lost."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                held = conn.execute("SELECT 1 FROM tasks WHERE id = ? AND status = 'running' AND worker = ?", (task_id, worker_id)).fetchone()
+                if held:
+                    conn.execute("DELETE FROM task_rows WHERE task_id = ?", (task_id,))
+                    conn.executemany("INSERT INTO task_rows (task_id, seq, row) VALUES (?, ?, ?)",
+                                     ((task_id, i, json.dumps(row, ensure_ascii=False)) for i, row in enumerate(store.iter_rows())))
+                    conn.execute("UPDATE tasks SET status = 'done', columns = ?, row_count = ?, error = NULL, lease_until = NULL, updated = ? "
+                                 "WHERE id = ?", (json.dumps(store.columns), len(store), time.time(), task_id))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return bool(held)
+
+    def fail(self, task_id: int, worker_id: str, error: str):
+        """Release a leased task after an error: requeue it, or mark it failed after max_attempts."""
+        with closing(self._connect()) as conn:
+            conn.execute("UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+                         "error = ?, lease_until = NULL, updated = ? WHERE id = ? AND status = 'running' AND worker = ?",
+                         (self.max_attempts, error, time.time(), task_id, worker_id))
+
+    def status(self, task_id: int):
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT id, task, status, attempts, worker, error, columns, row_count, created, updated "
+                               "FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if row is None:
+            return None
+        task = json.loads(row[1])
+        return {"id": row[0], "url": task["url"], "mode": task["mode"], "status": row[2], "attempts": row[3],
+                "worker": row[4], "error": row[5], "columns": json.loads(row[6]) if row[6] else None,
+                "rows": row[7], "created": row[8], "updated": row[9]}
+
+    def result_store(self, task_id: int):
+        """Load the rows of a finished task into a RowStore, or return None if it is not done."""
+        info = self.status(task_id)
+        if not info or info["status"] != "done":
+            return None
+        store = RowStore(info["columns"])
+        with closing(self._connect()) as conn:
+            for (row,) in conn.execute("SELECT row FROM task_rows WHERE task_id = ? ORDER BY seq", (task_id,)):
+                store.append(json.loads(row))
+        return store.freeze()
+
+def get_task_queue() -> TaskQueue:
+    global _TASK_QUEUE
+    if _TASK_QUEUE is None:
+        _TASK_QUEUE = TaskQueue(TASK_QUEUE_PATH)
+    return _TASK_QUEUE
+
+def run_worker(queue: TaskQueue, worker_id: str = None, poll_interval: float = 1.0, max_tasks: int = None):
+    """Claim and run tasks from `queue` until interrupted (or `max_tasks` have been handled).
+
+    Add capacity by starting more workers on the host that owns the queue file.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    handled = 0
+    while max_tasks is None or handled < max_tasks:
+        claimed = queue.claim(worker_id)
+        if claimed is None:
+            if max_tasks is not None:
+                break
+            time.sleep(poll_interval)
+            continue
+        task_id, task = claimed
+        last_beat = time.monotonic()
+
+        def heartbeat():
+            nonlocal last_beat
+            if time.monotonic() - last_beat < queue.lease_seconds / 10:
+                return
+            if not queue.heartbeat(task_id, worker_id):
+                raise RuntimeError(f"Lease on task {task_id} was lost")
+            last_beat = time.monotonic()
+
+        try:
+            store, stats = run_task(task, heartbeat)
+            if queue.complete(task_id, worker_id, store):
+                remember_seen_rows(stats)
+        except Exception as e:
+            traceback.print_exc()
+            queue.fail(task_id, worker_id, f"{type(e).__name__}: {e}")
+        handled += 1
+    return handled
+
+def iter_csv(store):
+    """Yield CSV text for a RowStore in roughly STREAM_CHUNK_BYTES pieces."""
+    mem = io.StringIO()
+    writer = csv.writer(mem, lineterminator='\n')
+    writer.writerow(store.columns)
+    for row in store.iter_rows():
+        writer.writerow(row)
+        if mem.tell() >= STREAM_CHUNK_BYTES:
+            yield mem.getvalue()
+            mem.seek(0)
+            mem.truncate()
+    yield mem.getvalue()
+
+def iter_json_records(store):
+    """Yield a JSON array of {column: value} records for a RowStore in pieces."""
+    columns = store.columns
+    parts = ['[']
+    size = 0
+    for i, row in enumerate(store.iter_rows()):
+        piece = (',' if i else '') + json.dumps(dict(zip(columns, row)), ensure_ascii=False)
+        parts.append(piece)
+        size += len(piece)
+        if size >= STREAM_CHUNK_BYTES:
+            yield ''.join(parts)
+            parts, size = [], 0
+    parts.append(']')
+    yield ''.join(parts)
+
+def render_table(store, limit: int = 100) -> str:
+    """HTML preview of the first `limit` rows, in the markup DataFrame.to_html produced before."""
+    parts = ['<table border="1" class="dataframe table table-striped table-hover">', '  <thead>', '    <tr style="text-align: right;">']
+    parts.extend(f'      <th>{c}</th>' for c in store.columns)
+    parts.extend(['    </tr>', '  </thead>', '  <tbody>'])
+    for row in store.iter_rows(limit):
+        parts.append('    <tr>')
+        parts.extend(f'      <td>{cell}</td>' for cell in row)
+        parts.append('    </tr>')
+    parts.extend(['  </tbody>', '</table>'])
+    return '\n'.join(parts)
+
+def iter_text_table(store):
+    """Yield a right-aligned fixed-width text table, like DataFrame.to_string(index=False)."""
+    widths = [len(c) for c in store.columns]
+    for row in store.iter_rows():
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    yield ' '.join(c.rjust(w) for c, w in zip(store.columns, widths))
+    for row in store.iter_rows():
+        yield '\n' + ' '.join(cell.rjust(w) for cell, w in zip(row, widths))
+
+def xlsx_bytes(store):
+    """Write a RowStore to an in-memory .xlsx file using openpyxl's write-only mode."""
+    import openpyxl
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(store.columns)
+    for row in store.iter_rows():
+        ws.append(row)
+    mem = io.BytesIO()
+    wb.save(mem)
+    mem.seek(0)
+    return mem
+
+def stream_download(chunks, filename: str, mimetype: str):
+    return Response(stream_with_context(c.encode() for c in chunks), mimetype=mimetype,
+                    headers={"Content-Disposition": f"attachment; filename={filename}"})
+
 @app.route("/download")
 def download():
     global _LAST_RESULTS
@@ -770,36 +2032,18 @@ def download():
     fmt = data["format"]
     mode = data["mode"]
 
-    if mode == 'autofind':
-        df = pd.DataFrame(results.get('rows', []), columns=results.get('columns', ['source_url', 'link_text', 'email'])) \
-             if results.get('rows') else pd.DataFrame(columns=results.get('columns', ['source_url', 'link_text', 'email']))
-        if fmt == 'csv':
-            mem = io.StringIO()
-            df.to_csv(mem, index=False)
-            return send_file(io.BytesIO(mem.getvalue().encode()), as_attachment=True, download_name='autofind_emails.csv', mimetype='text/csv')
-        if fmt == 'json':
-            return send_file(io.BytesIO(df.to_json(orient='records').encode()), as_attachment=True, download_name='autofind_emails.json', mimetype='application/json')
-        if fmt == 'xlsx':
-            mem = io.BytesIO()
-            with pd.ExcelWriter(mem, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False)
-            mem.seek(0)
-            return send_file(mem, as_attachment=True, download_name='autofind_emails.xlsx', mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-        mem = io.StringIO()
-        df.to_string(mem, index=False)
-        return send_file(io.BytesIO(mem.getvalue().encode()), as_attachment=True, download_name='autofind_emails.txt', mimetype='text/plain')
-
-    if mode == 'curl':
+    if mode == 'curl' and 'rows' not in results:
         content = results.get("raw_content", "")
         if fmt == "txt":
             return send_file(io.BytesIO(str(content).encode()), as_attachment=True, download_name=f"curl_{urlparse(data['url']).netloc}.txt", mimetype='text/plain')
         elif fmt == "json":
             try:
-                parsed = json.loads(content)
-                return send_file(io.BytesIO(json.dumps(parsed, indent=2).encode()), as_attachment=True, download_name='curl.json', mimetype='application/json')
+                json.loads(content)  # the preview is already indented; only check it is complete JSON
+                return send_file(io.BytesIO(content.encode()), as_attachment=True, download_name='curl.json', mimetype='application/json')
             except Exception:
                 return send_file(io.BytesIO(json.dumps({"content": content}).encode()), as_attachment=True, download_name='curl.json', mimetype='application/json')
         elif fmt == "xlsx":
+            import openpyxl
             wb = openpyxl.Workbook()
             ws = wb.active
             ws['A1'] = "Content"
@@ -814,23 +2058,60 @@ def download():
             mem.write(str(content).replace('\n', '\\n'))
             return send_file(io.BytesIO(mem.getvalue().encode()), as_attachment=True, download_name='curl.csv', mimetype='text/csv')
 
-    df = pd.DataFrame(results.get("rows", []), columns=results.get("columns", [])) if results.get('rows') else pd.DataFrame(columns=results.get('columns', []))
+    name = {"autofind": "autofind_emails", "curl": "curl_records"}.get(mode, "scraped")
     if fmt == "csv":
-        mem = io.StringIO()
-        df.to_csv(mem, index=False)
-        return send_file(io.BytesIO(mem.getvalue().encode()), as_attachment=True, download_name="scraped.csv", mimetype="text/csv")
+        return stream_download(iter_csv(results['rows']), f"{name}.csv", "text/csv")
     elif fmt == "json":
-        return send_file(io.BytesIO(df.to_json(orient="records").encode()), as_attachment=True, download_name="scraped.json", mimetype="application/json")
+        return stream_download(iter_json_records(results['rows']), f"{name}.json", "application/json")
     elif fmt == "xlsx":
-        mem = io.BytesIO()
-        with pd.ExcelWriter(mem, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False)
-        mem.seek(0)
-        return send_file(mem, as_attachment=True, download_name="scraped.xlsx", mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+        return send_file(xlsx_bytes(results['rows']), as_attachment=True, download_name=f"{name}.xlsx", mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
     else:  # txt
-        mem = io.StringIO()
-        df.to_string(mem, index=False)
-        return send_file(io.BytesIO(mem.getvalue().encode()), as_attachment=True, download_name="scraped.txt", mimetype='text/plain')
+        return stream_download(iter_text_table(results['rows']), f"{name}.txt", 'text/plain')
+
+@app.route("/jobs", methods=["POST"])
+def enqueue_jobs():
+    """Queue one task per URL (newline-separated `urls`, or the single `url` field) for the workers."""
+    form = request.get_json(silent=True) or request.form
+    urls = form.get("urls") or form.get("url", "")
+    if isinstance(urls, str):
+        urls = [u.strip() for u in urls.splitlines() if u.strip()]
+    try:
+        tasks = [task_from_form({**form, "url": u}) for u in urls] if urls else [task_from_form(form)]
+        if not all(is_tabular_task(t) for t in tasks):
+            raise ValueError("Only scrape, Auto Find and JSON-filtered curl tasks can be queued.")
+    except ValueError as e:
+        if request.is_json:
+            return jsonify({"error": str(e)}), 400
+        flash(str(e), "error")
+        return redirect(url_for("index"))
+
+    queue = get_task_queue()
+    ids = [queue.enqueue(t) for t in tasks]
+    if request.is_json:
+        return jsonify({"tasks": ids}), 202
+    flash(f"Queued {len(ids)} task(s): {', '.join(map(str, ids))}. Status at /jobs/<id>, results at /jobs/<id>/download.", "info")
+    return redirect(url_for("index"))
+
+@app.route("/jobs/<int:task_id>")
+def job_status(task_id: int):
+    info = get_task_queue().status(task_id)
+    if info is None:
+        return jsonify({"error": "Unknown task."}), 404
+    return jsonify(info)
+
+@app.route("/jobs/<int:task_id>/download")
+def job_download(task_id: int):
+    store = get_task_queue().result_store(task_id)
+    if store is None:
+        return jsonify({"error": "Task not finished."}), 404
+    if request.args.get("format", "csv") == "json":
+        return stream_download(iter_json_records(store), f"task_{task_id}.json", "application/json")
+    return stream_download(iter_csv(store), f"task_{task_id}.csv", "text/csv")
 
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    if len(sys.argv) > 1 and sys.argv[1] == "worker":
+        # one parse per worker process; scale out by running more workers on this host
+        EXTRACT_WORKERS = int(os.environ.get("SCRAPER_EXTRACT_WORKERS", 1))
+        run_worker(get_task_queue())
+    else:
+        app.run(debug=True, host="0.0.0.0", port=5000)
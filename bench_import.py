@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for app.py.
+
+Starts fresh interpreters that only `import app` and reports wall time, peak RSS and
+which heavy dependencies were loaded as a side effect. Run from the repo root:
+
+    python bench_import.py [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "bs4", "requests")
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"seconds": elapsed, "rss_kb": rss_kb, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+def run_probe(cwd: str) -> dict:
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=cwd, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    results = [run_probe(cwd) for _ in range(runs)]
+    times = [r["seconds"] * 1000 for r in results]
+    rss = [r["rss_kb"] / 1024 for r in results]
+    print(f"import app x{runs}: median {statistics.median(times):.1f} ms (min {min(times):.1f}, max {max(times):.1f})")
+    print(f"peak RSS: median {statistics.median(rss):.1f} MB")
+    print(f"heavy modules loaded at import: {', '.join(results[-1]['loaded']) or 'none'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import app
+
+def test_row_fingerprint_is_stable_and_field_aware():
+    assert app.row_fingerprint(['a', 'b']) == app.row_fingerprint(('a', 'b'))
+    assert app.row_fingerprint(['ab', '']) != app.row_fingerprint(['a', 'b'])
+    assert app.row_fingerprint(['a\x1fb']) != app.row_fingerprint(['a', 'b'])
+    assert app.row_fingerprint(['1:a']) != app.row_fingerprint(['', 'a'])
+    assert -2 ** 63 <= app.row_fingerprint(['x']) < 2 ** 63
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = app.BloomFilter(1000, error_rate=0.01)
+    fps = [app.row_fingerprint([str(i)]) for i in range(1000)]
+    assert all(bloom.add(fp) for fp in fps[:10])
+    for fp in fps[10:]:
+        bloom.add(fp)
+    assert all(fp in bloom for fp in fps)
+    assert not any(bloom.add(fp) for fp in fps)
+    false_positives = sum(app.row_fingerprint(['other', str(i)]) in bloom for i in range(10000))
+    assert false_positives < 300
+
+def test_row_deduper_exact_then_bloom():
+    deduper = app.RowDeduper(max_exact=100)
+    assert sum(deduper.add([str(i % 150)]) for i in range(300)) == 150
+    assert deduper._seen is None and len(deduper._blooms) == 1
+
+def test_row_deduper_adds_bloom_filters_instead_of_overfilling():
+    deduper = app.RowDeduper(max_exact=10, error_rate=0.001)
+    assert sum(deduper.add([str(i)]) for i in range(2000)) >= 1990
+    # each filter doubles the capacity and halves the error rate, keeping the total below 0.001
+    assert [b.capacity for b in deduper._blooms] == [100, 200, 400, 800, 1600]
+    assert not any(deduper.add([str(i)]) for i in range(2000))
+
+def test_row_deduper_filter_keeps_first_occurrence_order():
+    rows = [['b'], ['a'], ['b'], ['c'], ['a']]
+    assert list(app.RowDeduper().filter(rows)) == [['b'], ['a'], ['c']]
+
+def test_seen_rows_store_filters_across_runs(tmp_path):
+    path = str(tmp_path / 'seen.db')
+    rows = [[str(i), 'x'] for i in range(1200)]
+    fps = []
+    assert len(list(app.SeenRowsStore(path).filter_new('scrape:https://a.example', rows, fps))) == 1200
+    # nothing is recorded until the caller remembers the delivered rows
+    assert len(list(app.SeenRowsStore(path).filter_new('scrape:https://a.example', rows))) == 1200
+    app.SeenRowsStore(path).remember('scrape:https://a.example', fps)
+    again = list(app.SeenRowsStore(path).filter_new('scrape:https://a.example', rows + [['new', 'x']]))
+    assert again == [['new', 'x']]
+    assert len(list(app.SeenRowsStore(path).filter_new('scrape:https://b.example', rows[:5]))) == 5
+
+def test_unique_applies_to_json_filtered_curl_records(monkeypatch):
+    body = '{"data": [{"id": 1, "n": "a"}, {"n": "a", "id": 1}, {"id": 2, "n": "a"}]}'
+    monkeypatch.setattr(app, 'fetch_stream', lambda *a, **k: ((c for c in [body[:20], body[20:]]), 'application/json', {}))
+    task = {'url': 'https://api.example', 'mode': 'curl', 'json_filter': '$.data[*]', 'unique': True}
+    store, _ = app.run_task(task)
+    assert list(store) == [['1', 'a'], ['2', 'a']]
@@ -0,0 +1,37 @@
+import pytest
+
+import app
+
+HTML = '''<html>
+<script type="application/ld+json">{"@type": "Product", "name": "Widget", "offers": {"price": "9.99"}}</script>
+<script id="__NEXT_DATA__" type="application/json">{"props": {"pageProps": {"items": [{"name": "a", "price": 1}, {"name": "b", "price": 2}]}}}</script>
+<script>window.__INITIAL_STATE__ = {"user": {"name": "z"}}; var x = 1;</script>
+<script src="app.js"></script>
+</html>'''
+
+def test_extract_embedded_json_sources():
+    blobs = app.extract_embedded_json(HTML)
+    assert [source for source, _ in blobs] == ['application/ld+json', '__NEXT_DATA__', '__INITIAL_STATE__']
+
+def test_data_attributes_do_not_shadow_type_or_src():
+    html = '<script data-src="x" data-type="text/plain" type="application/ld+json">{"a": 1}</script>'
+    assert app.extract_embedded_json(html) == [('application/ld+json', {'a': 1})]
+
+def test_quoted_attribute_values_with_spaces_and_angle_brackets():
+    html = '<script data-note="a > b type=x" type="application/json" id="state">{"a": 2}</script>'
+    assert app.extract_embedded_json(html) == [('state', {'a': 2})]
+
+@pytest.mark.parametrize('expr, expected', [
+    ('$.props.pageProps.items[*].price', [1, 2]),
+    ("$['props'].pageProps.items[-1].name", ['b']),
+    ('$..name', ['a', 'b']),
+    ('props.pageProps.items[0]', [{'name': 'a', 'price': 1}]),
+    ('$.missing[*]', []),
+])
+def test_json_path_values(expr, expected):
+    data = app.extract_embedded_json(HTML)[1][1]
+    assert app.json_path_values(data, expr) == expected
+
+def test_compile_json_path_rejects_garbage():
+    with pytest.raises(ValueError):
+        app.compile_json_path('$.a[')
@@ -0,0 +1,33 @@
+from unittest.mock import Mock, patch
+
+import app
+
+def test_header_bom_and_meta_charsets():
+    assert app.detect_encoding(b'abc', 'text/html; charset=ISO-8859-1') == 'iso8859-1'
+    assert app.detect_encoding(b'\xef\xbb\xbfhi', 'text/html') == 'utf-8-sig'
+    assert app.detect_encoding(b'<meta charset="windows-1251">', 'text/html') == 'cp1251'
+
+def test_non_utf8_after_long_ascii_prefix():
+    body = b'a' * (70 * 1024) + 'café résumé'.encode('cp1252')
+    assert app.decode_body(body, 'text/html').endswith('café résumé')
+
+def test_utf8_character_across_sample_boundary():
+    body = b'a' * (app.DETECT_SAMPLE_BYTES - 1) + 'é'.encode('utf-8') + b'tail'
+    assert app.detect_encoding(body, 'text/html') == 'utf-8'
+
+def test_stream_chunk_ending_mid_character_is_utf8():
+    body = b'a' * (app.STREAM_CHUNK_BYTES - 1) + 'é'.encode('utf-8') + b'tail'
+    assert app.detect_encoding(body[:app.STREAM_CHUNK_BYTES], 'text/html', partial=True) == 'utf-8'
+
+    resp = Mock()
+    resp.headers = {'Content-Type': 'text/html'}
+    resp.iter_content = lambda chunk_size: (body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+    with patch('requests.request', return_value=resp):
+        chunks, _, _ = app.fetch_stream('https://example.com')
+        assert ''.join(chunks) == body.decode('utf-8')
+
+def test_utf8_body_is_decoded_once():
+    body = 'naïve café'.encode('utf-8')
+    with patch.object(app, 'detect_encoding', side_effect=AssertionError('decoded twice')):
+        assert app.decode_body(body, 'text/html') == 'naïve café'
+    assert app._detect_encoding(b'\xe9t\xe9', 'text/html')[1] is None
@@ -0,0 +1,103 @@
+import json
+import random
+
+import pytest
+
+import app
+
+DOCS = [
+    {"a": 1, "b": [1, 2, {"c": "x,y:\"q\" [] {}"}], "e": {}, "f": [], "g": None, "h": -1.5e3, "i": True},
+    [],
+    {},
+    [1, [2, [3, []]]],
+    "just a string",
+    12345,
+    {"unicode": "café 日本", "escaped": "\\u00e9 \\\\ \\/"},
+]
+
+def split_randomly(text, rng):
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, 7)
+        yield text[pos:pos + size]
+        pos += size
+
+@pytest.mark.parametrize('doc', DOCS)
+def test_json_preview_matches_json_dumps(doc):
+    rng = random.Random(0)
+    text = json.dumps(doc, ensure_ascii=False)
+    for _ in range(20):
+        preview, complete = app.json_preview(split_randomly(text, rng))
+        assert complete
+        assert preview == json.dumps(doc, indent=2, ensure_ascii=False)
+
+def test_json_preview_stops_reading_at_limit():
+    consumed = []
+
+    def chunks():
+        for i in range(100000):
+            consumed.append(i)
+            yield '[' if i == 0 else f'{i},'
+
+    preview, complete = app.json_preview(chunks(), limit=50)
+    assert not complete
+    assert len(preview) == 50
+    assert len(consumed) < 100
+
+@pytest.mark.parametrize('text', [
+    '[INFO] Server started on port 80\n[WARN] low disk',
+    '{ this is not json, really }',
+    '[1, 2',
+    '[1] trailing',
+    '{"a": 1,}',
+])
+def test_json_preview_shows_non_json_verbatim(text):
+    rng = random.Random(1)
+    for _ in range(10):
+        assert app.json_preview(split_randomly(text, rng)) == (text, True)
+
+def test_json_preview_non_json_fallback_respects_limit():
+    text = '[INFO] ' + 'x' * 500
+    assert app.json_preview([text[i:i + 7] for i in range(0, len(text), 7)], limit=50) == (text[:50], False)
+
+def test_read_preview():
+    assert app.read_preview(['ab', 'cd'], limit=10) == ('abcd', True)
+    assert app.read_preview(['ab', 'cd', 'ef'], limit=3) == ('abc', False)
+
+DATA = {
+    "meta": {"x": 1, "nested": {"deep": [10, 20, 30]}},
+    "data": [{"id": i, "name": f"n{i}", "tags": ["a", "b"]} for i in range(5)],
+    "tail": 3,
+}
+
+@pytest.mark.parametrize('expr', [
+    '$.data[*]',
+    '$.data[*].name',
+    '$.data[*].tags[1]',
+    '$.data[2]',
+    '$.data[-1].id',
+    '$..id',
+    '$.tail',
+    '$.meta.x',
+    '$.meta.nested.deep[*]',
+    '$.meta[*]',
+    '$.nope[*]',
+    '$.data[9]',
+])
+@pytest.mark.parametrize('chunk_size', [1, 3, 64])
+def test_iter_json_path_stream_matches_in_memory(expr, chunk_size):
+    text = json.dumps(DATA)
+    chunks = (text[i:i + chunk_size] for i in range(0, len(text), chunk_size))
+    assert list(app.iter_json_path_stream(chunks, expr)) == app.json_path_values(DATA, expr)
+
+def test_iter_json_path_stream_top_level_array_and_numbers_split_across_chunks():
+    text = json.dumps([{"v": 123456789}, {"v": -0.5e-3}, 42])
+    chunks = [text[:12], text[12:13], text[13:]]
+    assert list(app.iter_json_path_stream(chunks, '$[*]')) == [{"v": 123456789}, {"v": -0.5e-3}, 42]
+
+def test_records_to_rows():
+    store = app.RowStore([])
+    for record in [{"a": 1}, {"b": [2]}, "plain"]:
+        store.append_dict(app.record_to_row(record))
+    assert store.columns == ['a', 'b', 'value']
+    assert list(store) == [['1', '', ''], ['', '[2]', ''], ['', '', 'plain']]
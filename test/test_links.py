@@ -0,0 +1,20 @@
+import app
+
+BASE = 'https://example.com/'
+
+def test_unclosed_anchor_does_not_swallow_next_link():
+    html = '<a href="/home">Home<a href="/contact">Contact</a>'
+    assert app.find_contact_links(html, BASE) == [('https://example.com/contact', 'Contact')]
+
+def test_attribute_values_containing_angle_brackets():
+    html = '<a data-x="1>2" href="/contact">Write to us</a>'
+    assert app.find_contact_links(html, BASE) == [('https://example.com/contact', 'Write to us')]
+
+def test_ranking_limit_and_non_http_links():
+    html = ('<a href="/about">About</a>'
+            '<a href="/contact-us">Contact <b>us</b></a>'
+            '<a href="mailto:support@example.com">mail</a>'
+            '<a href="/help/deep/support">Help</a>'
+            '<a href="/contact-us">Contact again</a>')
+    links = app.find_contact_links(html, BASE, limit=2)
+    assert links == [('https://example.com/contact-us', 'Contact us'), ('https://example.com/about', 'About')]
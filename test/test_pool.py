@@ -0,0 +1,48 @@
+import os
+import pytest
+
+import app
+
+# workers re-import this module (forkserver/spawn), so keep the parent's pid in the environment
+MAIN_PID = int(os.environ.setdefault('SCRAPER_TEST_MAIN_PID', str(os.getpid())))
+
+def die_in_worker(value):
+    if os.getpid() != MAIN_PID:
+        os._exit(1)
+    return value * 2
+
+def double(value):
+    return value * 2
+
+@pytest.fixture
+def pool_workers(monkeypatch):
+    monkeypatch.setattr(app, "EXTRACT_WORKERS", 2)
+    app._reset_extract_pool()
+    yield
+    app._reset_extract_pool()
+
+def test_bounded_map_keeps_order(pool_workers):
+    jobs = ((i, (i,)) for i in range(10))
+    assert list(app.bounded_map(double, jobs, max_pending=3)) == [(i, i * 2) for i in range(10)]
+
+def test_bounded_map_falls_back_inline_when_pool_breaks(pool_workers):
+    jobs = ((i, (i,)) for i in range(5))
+    assert list(app.bounded_map(die_in_worker, jobs, max_pending=1)) == [(i, i * 2) for i in range(5)]
+    assert app._EXTRACT_POOL is None
+
+def test_run_extraction_falls_back_inline_when_pool_breaks(pool_workers):
+    assert app.run_extraction(die_in_worker, 21) == 42
+
+def test_concurrent_first_use_creates_one_pool(pool_workers):
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(8) as threads:
+        pools = list(threads.map(lambda _: app.get_extract_pool(), range(8)))
+    assert all(pool is pools[0] for pool in pools)
+
+def test_reset_ignores_a_pool_that_was_already_replaced(pool_workers):
+    stale = app.get_extract_pool()
+    app._reset_extract_pool(stale)
+    fresh = app.get_extract_pool()
+    app._reset_extract_pool(stale)
+    assert app._EXTRACT_POOL is fresh
+    assert app.run_extraction(double, 4) == 8
@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+import app
+
+TASK = {'url': 'https://example.com', 'mode': 'scrape', 'selectors': ['.t']}
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return str(tmp_path / 'queue.db')
+
+def test_claim_complete_and_load_results(queue_path):
+    queue = app.TaskQueue(queue_path)
+    task_id = queue.enqueue(TASK)
+    assert queue.claim('w1') == (task_id, TASK)
+    assert queue.claim('w2') is None
+    assert queue.complete(task_id, 'w1', app.RowStore(['.t'], [['A'], ['B']]))
+    assert queue.status(task_id)['status'] == 'done'
+    assert list(queue.result_store(task_id)) == [['A'], ['B']]
+
+def test_lease_expiry_retry_and_failure(queue_path):
+    queue = app.TaskQueue(queue_path, lease_seconds=-1, max_attempts=2)
+    task_id = queue.enqueue(TASK)
+    assert queue.claim('w1')[0] == task_id
+    # the lease has already expired, so another worker takes over
+    assert queue.claim('w2')[0] == task_id
+    assert not queue.complete(task_id, 'w1', app.RowStore(['.t']))
+    assert not queue.heartbeat(task_id, 'w1')
+    # out of attempts: the expired task is marked failed instead of being handed out again
+    assert queue.claim('w3') is None
+    info = queue.status(task_id)
+    assert info['status'] == 'failed' and info['attempts'] == 2
+
+def test_fail_requeues_until_max_attempts(queue_path):
+    queue = app.TaskQueue(queue_path, max_attempts=2)
+    task_id = queue.enqueue(TASK)
+    queue.claim('w1')
+    queue.fail(task_id, 'w1', 'boom')
+    assert queue.status(task_id)['status'] == 'queued'
+    queue.claim('w1')
+    queue.fail(task_id, 'w1', 'boom')
+    assert queue.status(task_id)['status'] == 'failed'
+
+def test_heartbeat_keeps_slow_task_leased(queue_path, monkeypatch):
+    queue = app.TaskQueue(queue_path, lease_seconds=0.3)
+    task_id = queue.enqueue(TASK)
+
+    def slow_task(task, heartbeat):
+        for _ in range(6):
+            time.sleep(0.1)
+            heartbeat()
+            assert queue.claim('intruder') is None
+        return app.RowStore(['.t'], [['A']]), {}
+
+    monkeypatch.setattr(app, 'run_task', slow_task)
+    assert app.run_worker(queue, 'w1', max_tasks=1) == 1
+    info = queue.status(task_id)
+    assert info['status'] == 'done' and info['attempts'] == 1
+
+def test_skip_seen_rows_survive_a_lost_lease(queue_path, tmp_path, monkeypatch):
+    monkeypatch.setattr(app, 'SEEN_ROWS_PATH', str(tmp_path / 'seen.db'))
+    monkeypatch.setattr(app, 'fetch_data', lambda *a, **k: ('<p class="t">A</p><p class="t">B</p>', 'text/html', {}))
+    monkeypatch.setattr(app, 'EXTRACT_WORKERS', 1)
+    queue = app.TaskQueue(queue_path, max_attempts=3)
+    task_id = queue.enqueue(dict(TASK, skip_seen=True))
+    real_complete = queue.complete
+    # the first worker loses its lease before storing the result, so the task is retried
+    monkeypatch.setattr(queue, 'complete', lambda *a: False)
+    app.run_worker(queue, 'w1', max_tasks=1)
+    queue.fail(task_id, 'w1', 'lease lost')
+    monkeypatch.setattr(queue, 'complete', real_complete)
+    app.run_worker(queue, 'w2', max_tasks=1)
+    assert list(queue.result_store(task_id)) == [['A'], ['B']]
+    # once stored, the same rows are skipped by the next run
+    store, _ = app.run_task(dict(TASK, skip_seen=True))
+    assert len(store) == 0
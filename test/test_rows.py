@@ -0,0 +1,47 @@
+import sys
+
+import app
+
+def test_round_trip_with_low_and_high_cardinality_columns():
+    rows = [['https://example.com/contact', 'Contact', f'user{i}@example.com'] for i in range(100)]
+    store = app.RowStore(['source_url', 'link_text', 'email'], rows)
+    assert list(store) == rows
+    assert list(store.iter_rows(3)) == rows[:3]
+    assert len(store) == 100
+
+def test_frozen_store_drops_lookups_and_packs_columns():
+    store = app.RowStore(['url', 'email'], ([['https://a.example', f'u{i}@x.com'] for i in range(1000)]))
+    assert store._lookup is None
+    assert store._values[0] == ('https://a.example',)
+    blob, ends = store._cells[1]
+    assert isinstance(blob, bytes) and len(ends) == 1000
+
+def test_append_after_freeze_and_dynamic_columns():
+    store = app.RowStore(['a'], [['x'], ['y'], ['x']])
+    store.append(['z'])
+    store.append_dict({'a': 'w', 'b': 'new'})
+    store.freeze()
+    assert store.columns == ['a', 'b']
+    assert list(store) == [['x', ''], ['y', ''], ['x', ''], ['z', ''], ['w', 'new']]
+
+def test_append_dict_with_keys_in_any_order():
+    store = app.RowStore([])
+    store.append_dict({'b': 1, 'a': 2})
+    store.append_dict({'c': 3, 'a': 4})
+    store.append_dict({})
+    assert store.columns == ['b', 'a', 'c']
+    assert list(store) == [['1', '2', ''], ['', '4', '3'], ['', '', '']]
+
+def test_non_ascii_and_surrogates_survive_packing():
+    values = ['café', '日本語', '\ud800', '']
+    store = app.RowStore(['v'], [[v] for v in values])
+    assert [r[0] for r in store] == values
+
+def test_frozen_store_is_smaller_than_list_of_lists():
+    rows = [[f'value-{i}', f'other-{i}'] for i in range(5000)]
+    store = app.RowStore(['a', 'b'], rows)
+    blob_a, ends_a = store._cells[0]
+    blob_b, ends_b = store._cells[1]
+    packed = sum(sys.getsizeof(x) for x in (blob_a, ends_a, blob_b, ends_b))
+    plain = sys.getsizeof(rows) + sum(sys.getsizeof(r) + sum(sys.getsizeof(c) for c in r) for r in rows)
+    assert packed * 3 < plain